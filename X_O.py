@@ -4,108 +4,76 @@ Console Tic-Tac-Toe (X O)
 - Modes: Human vs Human, Human vs Computer
 - Difficulty: easy / medium / hard (Minimax)
 - Run: python main.py
+- PyPy: pypy3 X_O.py (pure Python, no C extensions; the JIT speeds up the
+  search used by medium mode)
 """
 import random
-from typing import List, Optional, Tuple
-
-WIN_COMBINATIONS = [
-    (0,1,2), (3,4,5), (6,7,8),
-    (0,3,6), (1,4,7), (2,5,8),
-    (0,4,8), (2,4,6)
-]
-
-def print_board(board: List[str]):
-    def cell(i):
-        return board[i] if board[i] != ' ' else str(i+1)
-    print()
-    print(f" {cell(0)} | {cell(1)} | {cell(2)} ")
-    print("---+---+---")
-    print(f" {cell(3)} | {cell(4)} | {cell(5)} ")
-    print("---+---+---")
-    print(f" {cell(6)} | {cell(7)} | {cell(8)} ")
-    print()
-
-def check_winner(board: List[str]) -> Optional[str]:
-    for (a,b,c) in WIN_COMBINATIONS:
-        if board[a] == board[b] == board[c] and board[a] != ' ':
-            return board[a]
-    return None
-
-def is_full(board: List[str]) -> bool:
-    return all(c != ' ' for c in board)
-
-def available_moves(board: List[str]) -> List[int]:
-    return [i for i, c in enumerate(board) if c == ' ']
-
-def evaluate_board(board: List[str]) -> Optional[str]:
-    return check_winner(board)
-
-def minimax(board: List[str], depth: int, maximizing: bool, ai_player: str, human_player: str) -> Tuple[int, Optional[int]]:
-    winner = evaluate_board(board)
-    if winner == ai_player:
-        return (10 - depth, None)
-    elif winner == human_player:
-        return (depth - 10, None)
-    elif all(c != ' ' for c in board):
-        return (0, None)
-
-    if maximizing:
-        best_score = -999
-        best_move = None
-        for move in available_moves(board):
-            board[move] = ai_player
-            score, _ = minimax(board, depth+1, False, ai_player, human_player)
-            board[move] = ' '
-            if score > best_score:
-                best_score = score
-                best_move = move
-        return (best_score, best_move)
-    else:
-        best_score = 999
-        best_move = None
-        for move in available_moves(board):
-            board[move] = human_player
-            score, _ = minimax(board, depth+1, True, ai_player, human_player)
-            board[move] = ' '
-            if score < best_score:
-                best_score = score
-                best_move = move
-        return (best_score, best_move)
-
-def human_turn(board: List[str], marker: str):
-    moves = available_moves(board)
+import sys
+from typing import List, Tuple
+
+from ai import FULL_BOARD, O, WINS, X, best_move, search_move
+
+BOARD_TEMPLATE = (
+    "\n"
+    " {} | {} | {} \n"
+    "---+---+---\n"
+    " {} | {} | {} \n"
+    "---+---+---\n"
+    " {} | {} | {} \n"
+    "\n"
+)
+DIGITS = ('1', '2', '3', '4', '5', '6', '7', '8', '9')
+SYMBOLS = {X: 'X', O: 'O'}
+
+def print_board(x_bb: int, o_bb: int):
+    cells = [SYMBOLS[X] if x_bb >> i & 1
+             else SYMBOLS[O] if o_bb >> i & 1
+             else DIGITS[i]
+             for i in range(9)]
+    sys.stdout.write(BOARD_TEMPLATE.format(*cells))
+
+def available_moves(x_bb: int, o_bb: int) -> List[int]:
+    moves = []
+    empty = ~(x_bb | o_bb) & FULL_BOARD
+    while empty:
+        bit = empty & -empty
+        moves.append(bit.bit_length() - 1)
+        empty ^= bit
+    return moves
+
+def play_move(x_bb: int, o_bb: int, marker: int, idx: int) -> Tuple[int, int]:
+    if marker == X:
+        return (x_bb | (1 << idx), o_bb)
+    return (x_bb, o_bb | (1 << idx))
+
+def human_turn(x_bb: int, o_bb: int, marker: int) -> int:
+    occupied = x_bb | o_bb
     while True:
         try:
-            choice = input(f"Player {marker}, enter move (1-9): ").strip()
+            choice = input(f"Player {SYMBOLS[marker]}, enter move (1-9): ").strip()
             if choice.lower() in ('q','quit','exit'):
                 print("Exiting game.")
                 exit(0)
             idx = int(choice) - 1
-            if idx in moves:
-                board[idx] = marker
-                return
+            if 0 <= idx < 9 and not occupied & (1 << idx):
+                return idx
             else:
                 print("Invalid move — choose an empty cell number (1-9).")
         except ValueError:
             print("Please enter a number between 1 and 9, or 'q' to quit.")
 
-def computer_turn(board: List[str], ai: str, human: str, difficulty: str):
-    moves = available_moves(board)
+def computer_turn(x_bb: int, o_bb: int, ai: int, human: int, difficulty: str) -> int:
     if difficulty == 'easy':
-        move = random.choice(moves)
+        move = random.choice(available_moves(x_bb, o_bb))
     elif difficulty == 'medium':
         if random.random() < 0.6:
-            _, move = minimax(board[:], 0, True, ai, human)
-            if move is None:
-                move = random.choice(moves)
+            move = search_move(x_bb, o_bb, ai)
         else:
-            move = random.choice(moves)
+            move = random.choice(available_moves(x_bb, o_bb))
     else:  # hard
-        _, move = minimax(board[:], 0, True, ai, human)
-        if move is None:
-            move = random.choice(moves)
-    board[move] = ai
-    print(f"Computer ({ai}) plays position {move+1}.")
+        move = best_move(x_bb, o_bb, ai)
+    print(f"Computer ({SYMBOLS[ai]}) plays position {move+1}.")
+    return move
 
 def choose_mode() -> str:
     while True:
@@ -117,13 +85,13 @@ def choose_mode() -> str:
             return 'HvH'
         print("Invalid choice.")
 
-def choose_marker() -> str:
+def choose_marker() -> int:
     while True:
         c = input("Choose your marker (X or O) [default X]: ").strip().upper()
-        if c == '':
-            return 'X'
-        if c in ('X','O'):
-            return c
+        if c == '' or c == 'X':
+            return X
+        if c == 'O':
+            return O
         print("Invalid choice.")
 
 def choose_difficulty() -> str:
@@ -142,38 +110,41 @@ def play_game():
     print("=== Tic-Tac-Toe (Console) ===")
     while True:
         mode = choose_mode()
-        human_marker = 'X'
+        human_marker = X
         difficulty = 'hard'
         if mode == 'HvC':
             human_marker = choose_marker()
             difficulty = choose_difficulty()
-            ai_marker = 'O' if human_marker == 'X' else 'X'
+            ai_marker = O if human_marker == X else X
         else:
             ai_marker = None
 
-        board = [' '] * 9
-        current = 'X'
+        x_bb, o_bb = 0, 0
+        moves_made = 0
+        current = X
 
-        print_board(board)
+        print_board(x_bb, o_bb)
         while True:
             if mode == 'HvH':
-                print(f"Current: {current}")
-                human_turn(board, current)
+                print(f"Current: {SYMBOLS[current]}")
+                move = human_turn(x_bb, o_bb, current)
             else:  # HvC
                 if current == human_marker:
-                    human_turn(board, current)
+                    move = human_turn(x_bb, o_bb, current)
                 else:
-                    computer_turn(board, ai_marker, human_marker, difficulty)
-
-            print_board(board)
-            winner = check_winner(board)
-            if winner:
-                print(f"Player {winner} wins!")
+                    move = computer_turn(x_bb, o_bb, ai_marker, human_marker, difficulty)
+            x_bb, o_bb = play_move(x_bb, o_bb, current, move)
+            moves_made += 1
+
+            print_board(x_bb, o_bb)
+            # Only the player who just moved can have completed a line.
+            if WINS[x_bb if current == X else o_bb]:
+                print(f"Player {SYMBOLS[current]} wins!")
                 break
-            if is_full(board):
+            if moves_made == 9:
                 print("It's a tie!")
                 break
-            current = 'O' if current == 'X' else 'X'
+            current = O if current == X else X
 
         again = input("Play again? (y/n) [y]: ").strip().lower()
         if again == '' or again.startswith('y'):
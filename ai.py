@@ -0,0 +1,171 @@
+"""
+Tic-Tac-Toe AI shared by the game front ends
+- Board state: two 9-bit ints (x_bb, o_bb); bit i is cell i
+- best_move: lookup in the game solved at import (hard)
+- search_move: live alpha-beta search (medium)
+"""
+import random
+from operator import xor
+from typing import Dict, Optional, Tuple
+
+# Board state is a pair of 9-bit bitboards (x_bb, o_bb); bit i is cell i.
+FULL_BOARD = 0x1FF
+
+# Player markers; X always moves first.
+X, O = 1, 2
+
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100
+)
+
+# Candidate moves in search order: center, corners, then edges, so the
+# strongest replies are tried first and alpha-beta cuts off sooner.
+ORDER_MASKS = (1 << 4, 1 << 0, 1 << 2, 1 << 6, 1 << 8, 1 << 1, 1 << 3, 1 << 5, 1 << 7)
+
+# WINS[bb] is 1 iff the 9-bit bitboard bb contains a complete line; the same
+# table serves both X and O.
+WINS = bytearray(512)
+for _bb in range(512):
+    WINS[_bb] = any((_bb & m) == m for m in WIN_MASKS)
+
+# The eight symmetries of the board (rotations and reflections) as cell
+# permutations: SYMS[k][i] is where cell i lands under symmetry k.
+SYMS = tuple(
+    tuple(3 * r2 + c2 for r2, c2 in (f(i // 3, i % 3) for i in range(9)))
+    for f in (
+        lambda r, c: (r, c), lambda r, c: (c, 2 - r),
+        lambda r, c: (2 - r, 2 - c), lambda r, c: (2 - c, r),
+        lambda r, c: (r, 2 - c), lambda r, c: (2 - r, c),
+        lambda r, c: (c, r), lambda r, c: (2 - c, 2 - r),
+    )
+)
+INV_SYMS = tuple(tuple(sym.index(i) for i in range(9)) for sym in SYMS)
+
+# Zobrist keys: one per (side, cell) plus one for the side to move.
+_zobrist_rng = random.Random(0x5A0B)
+ZOB = [[_zobrist_rng.getrandbits(64) for _ in range(9)] for _ in range(2)]
+ZOB_SIDE = _zobrist_rng.getrandbits(64)
+# ZOB_SYM[side][cell]: the XOR that playing `cell` applies to each of the
+# eight symmetric hashes of a position.
+ZOB_SYM = [[tuple(ZOB[side][sym[i]] ^ ZOB_SIDE for sym in SYMS) for i in range(9)]
+           for side in range(2)]
+
+# Transposition table, keyed by the smallest of a position's eight symmetric
+# hashes: hash -> (score, move cell in that canonical frame, flag).
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+TT: Dict[int, Tuple[int, int, int]] = {}
+
+def zobrist_hashes(x_bb: int, o_bb: int, to_move: int) -> Tuple[int, ...]:
+    hashes = []
+    for sym in SYMS:
+        h = ZOB_SIDE if to_move == O else 0
+        for i in range(9):
+            if x_bb & (1 << i):
+                h ^= ZOB[0][sym[i]]
+            elif o_bb & (1 << i):
+                h ^= ZOB[1][sym[i]]
+        hashes.append(h)
+    return tuple(hashes)
+
+def negamax(x_bb: int, o_bb: int, to_move: int, alpha: int, beta: int,
+            hashes: Optional[Tuple[int, ...]] = None) -> Tuple[int, Optional[int]]:
+    # Scores are for the side to move and depend only on the position
+    # (quicker wins score higher), so TT entries stay valid across searches.
+    if hashes is None:
+        hashes = zobrist_hashes(x_bb, o_bb, to_move)
+    key = min(hashes)
+    k = hashes.index(key)
+    hit = TT.get(key)
+    if hit is not None:
+        score, move, flag = hit
+        if flag == TT_EXACT or (flag == TT_LOWER and score >= beta) or (flag == TT_UPPER and score <= alpha):
+            return (score, 1 << INV_SYMS[k][move])
+
+    occ = x_bb | o_bb
+    # Only the side that just moved can have completed a line.
+    if WINS[o_bb if to_move == X else x_bb]:
+        return (bin(occ).count('1') - 10, None)
+    if occ == FULL_BOARD:
+        return (0, None)
+    empty = occ ^ FULL_BOARD
+
+    alpha_orig = alpha
+    side = 0 if to_move == X else 1
+    best_score = -999
+    best_move = None
+    for bit in ORDER_MASKS:
+        if not empty & bit:
+            continue
+        child_hashes = tuple(map(xor, hashes, ZOB_SYM[side][bit.bit_length() - 1]))
+        if side == 0:
+            score = -negamax(x_bb | bit, o_bb, O, -beta, -alpha, child_hashes)[0]
+        else:
+            score = -negamax(x_bb, o_bb | bit, X, -beta, -alpha, child_hashes)[0]
+        if score > best_score:
+            best_score = score
+            best_move = bit
+        alpha = max(alpha, score)
+        if alpha >= beta:
+            break
+
+    canon_move = SYMS[k][best_move.bit_length() - 1]
+    if best_score <= alpha_orig:
+        TT[key] = (best_score, canon_move, TT_UPPER)
+    elif best_score >= beta:
+        TT[key] = (best_score, canon_move, TT_LOWER)
+    else:
+        TT[key] = (best_score, canon_move, TT_EXACT)
+    return (best_score, best_move)
+
+# Every reachable position solved once at import:
+# (x_bb, o_bb, to_move) -> best move bit for the side to move.
+BEST_MOVE: Dict[Tuple[int, int, int], int] = {}
+
+def _solve(x_bb: int, o_bb: int, to_move: int, memo: Dict[Tuple[int, int, int], int]) -> int:
+    # Exact score for the side to move, on the same scale as negamax.
+    key = (x_bb, o_bb, to_move)
+    if key in memo:
+        return memo[key]
+    occ = x_bb | o_bb
+    if WINS[o_bb if to_move == X else x_bb]:
+        best_score = bin(occ).count('1') - 10
+    elif occ == FULL_BOARD:
+        best_score = 0
+    else:
+        empty = occ ^ FULL_BOARD
+        best_score = -999
+        best_move = 0
+        while empty:
+            bit = empty & -empty
+            empty ^= bit
+            if to_move == X:
+                score = -_solve(x_bb | bit, o_bb, O, memo)
+            else:
+                score = -_solve(x_bb, o_bb | bit, X, memo)
+            if score > best_score:
+                best_score = score
+                best_move = bit
+        BEST_MOVE[key] = best_move
+    memo[key] = best_score
+    return best_score
+
+_solve(0, 0, X, {})
+
+# Opening book for the computer's first move, as either side:
+# (x_bb, o_bb, to_move) -> cell. Take the center; if X already holds it,
+# answer in a corner.
+OPENING: Dict[Tuple[int, int, int], int] = {(0, 0, X): 4, (1 << 4, 0, O): 0}
+for _cell in (0, 1, 2, 3, 5, 6, 7, 8):
+    OPENING[(1 << _cell, 0, O)] = 4
+
+def best_move(x_bb: int, o_bb: int, to_move: int) -> int:
+    return BEST_MOVE[(x_bb, o_bb, to_move)].bit_length() - 1
+
+def search_move(x_bb: int, o_bb: int, to_move: int) -> int:
+    book = OPENING.get((x_bb, o_bb, to_move))
+    if book is not None:
+        return book
+    _, bit = negamax(x_bb, o_bb, to_move, -999, 999)
+    return bit.bit_length() - 1
@@ -0,0 +1,76 @@
+"""
+Exhaustive checks of the AI against a plain minimax solver.
+- Run: python -m unittest
+"""
+import unittest
+from functools import lru_cache
+from typing import Iterator, Tuple
+
+import ai
+from ai import FULL_BOARD, O, WIN_MASKS, X
+
+def _other(player: int) -> int:
+    return O if player == X else X
+
+def _play(x_bb: int, o_bb: int, player: int, cell: int) -> Tuple[int, int]:
+    if player == X:
+        return (x_bb | (1 << cell), o_bb)
+    return (x_bb, o_bb | (1 << cell))
+
+def _won(bb: int) -> bool:
+    return any((bb & m) == m for m in WIN_MASKS)
+
+@lru_cache(maxsize=None)
+def _value(x_bb: int, o_bb: int, to_move: int) -> int:
+    # Plain minimax outcome for the side to move: 1 win, 0 draw, -1 loss.
+    if _won(x_bb) or _won(o_bb):
+        return -1
+    if (x_bb | o_bb) == FULL_BOARD:
+        return 0
+    return max(-_value(*_play(x_bb, o_bb, to_move, cell), _other(to_move))
+               for cell in range(9) if not (x_bb | o_bb) & (1 << cell))
+
+def _positions() -> Iterator[Tuple[int, int, int]]:
+    # Every non-terminal position reachable from the empty board, X first.
+    seen = set()
+    stack = [(0, 0, X)]
+    while stack:
+        x_bb, o_bb, to_move = stack.pop()
+        if (x_bb, o_bb) in seen or _won(x_bb) or _won(o_bb) or (x_bb | o_bb) == FULL_BOARD:
+            continue
+        seen.add((x_bb, o_bb))
+        yield (x_bb, o_bb, to_move)
+        for cell in range(9):
+            if not (x_bb | o_bb) & (1 << cell):
+                stack.append((*_play(x_bb, o_bb, to_move, cell), _other(to_move)))
+
+class OptimalPlayTest(unittest.TestCase):
+    def assertOptimal(self, x_bb: int, o_bb: int, to_move: int, cell: int):
+        self.assertFalse((x_bb | o_bb) & (1 << cell), (x_bb, o_bb, to_move, cell))
+        after = -_value(*_play(x_bb, o_bb, to_move, cell), _other(to_move))
+        self.assertEqual(after, _value(x_bb, o_bb, to_move), (x_bb, o_bb, to_move, cell))
+
+    def test_search_move_is_optimal(self):
+        for x_bb, o_bb, to_move in _positions():
+            self.assertOptimal(x_bb, o_bb, to_move, ai.search_move(x_bb, o_bb, to_move))
+
+    def test_symmetric_positions_share_tt_entries(self):
+        for x_bb, o_bb, to_move in ((1 << 0, 1 << 4, X), (1 << 1 | 1 << 5, 1 << 4, O)):
+            ai.TT.clear()
+            ai.search_move(x_bb, o_bb, to_move)
+            size = len(ai.TT)
+            for sym in ai.SYMS:
+                sx = sum(1 << sym[i] for i in range(9) if x_bb & (1 << i))
+                so = sum(1 << sym[i] for i in range(9) if o_bb & (1 << i))
+                self.assertOptimal(sx, so, to_move, ai.search_move(sx, so, to_move))
+            self.assertEqual(len(ai.TT), size)
+
+    def test_best_move_covers_every_position(self):
+        self.assertEqual(set(ai.BEST_MOVE), set(_positions()))
+
+    def test_best_move_is_optimal(self):
+        for x_bb, o_bb, to_move in _positions():
+            self.assertOptimal(x_bb, o_bb, to_move, ai.best_move(x_bb, o_bb, to_move))
+
+if __name__ == "__main__":
+    unittest.main()